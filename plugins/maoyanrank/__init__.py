@@ -2,6 +2,7 @@ import datetime
 import json
 import random
 import re
+from operator import itemgetter
 from threading import Event
 from typing import Tuple, List, Dict, Any
 
@@ -20,6 +21,9 @@ from app.log import logger
 from app.plugins import _PluginBase
 from app.schemas import MediaType
 
+# 上映天数的数字提取正则, 预编译后每条榜单数据复用
+_digit_pattern = re.compile(r'\d')
+
 
 class MaoyanRank(_PluginBase):
     """
@@ -68,6 +72,8 @@ class MaoyanRank(_PluginBase):
     _num = 10
     _seriesType = [0, 1, 2]
     _platform = 0
+    # 表单为纯静态内容, 构建一次后复用
+    _form_schema = None
 
     def init_plugin(self, config: dict = None):
         self.downloadchain = DownloadChain()
@@ -140,6 +146,21 @@ class MaoyanRank(_PluginBase):
         pass
 
     def get_form(self) -> Tuple[List[dict], Dict[str, Any]]:
+        if MaoyanRank._form_schema is None:
+            MaoyanRank._form_schema = self.__build_form_schema()
+        return MaoyanRank._form_schema, {
+            "enabled": False,
+            "onlyonce": False,
+            "cron": "",
+            "clear": False,
+            "type": ['movie', 'web-heat'],
+            "num": 10,
+            "seriesType": [0, 1, 2],
+            "platform": 0,
+        }
+
+    @staticmethod
+    def __build_form_schema() -> List[dict]:
         return [
             {
                 'component': 'VForm',
@@ -327,16 +348,7 @@ class MaoyanRank(_PluginBase):
                     },
                 ]
             }
-        ], {
-            "enabled": False,
-            "onlyonce": False,
-            "cron": "",
-            "clear": False,
-            "type": ['movie', 'web-heat'],
-            "num": 10,
-            "seriesType": [0, 1, 2],
-            "platform": 0,
-        }
+        ]
 
     def get_page(self) -> List[dict]:
         """
@@ -354,10 +366,17 @@ class MaoyanRank(_PluginBase):
                     }
                 }
             ]
-        # 数据按时间降序排序
-        historys = sorted(historys, key=lambda x: x.get('time'), reverse=True)
+        # 数据按时间降序排序, itemgetter走C实现比lambda更快
+        historys = sorted(historys, key=itemgetter('time'), reverse=True)
         # 拼装页面
         contents = []
+        # 每条记录的文字节点样式一致, 复用同一个props字典减少重复构造
+        subtitle_props = {
+            'class': 'pa-2 font-bold break-words whitespace-break-spaces'
+        }
+        text_props = {
+            'class': 'pa-0 px-2'
+        }
         for history in historys:
             title = history.get("title")
             poster = history.get("poster")
@@ -401,9 +420,7 @@ class MaoyanRank(_PluginBase):
                                     'content': [
                                         {
                                             'component': 'VCardSubtitle',
-                                            'props': {
-                                                'class': 'pa-2 font-bold break-words whitespace-break-spaces'
-                                            },
+                                            'props': subtitle_props,
                                             'content': [
                                                 {
                                                     'component': 'a',
@@ -417,30 +434,22 @@ class MaoyanRank(_PluginBase):
                                         },
                                         {
                                             'component': 'VCardText',
-                                            'props': {
-                                                'class': 'pa-0 px-2'
-                                            },
+                                            'props': text_props,
                                             'text': f'{release_info}'
                                         },
                                         {
                                             'component': 'VCardText',
-                                            'props': {
-                                                'class': 'pa-0 px-2'
-                                            },
+                                            'props': text_props,
                                             'text': f'平台：{platform}'
                                         },
                                         {
                                             'component': 'VCardText',
-                                            'props': {
-                                                'class': 'pa-0 px-2'
-                                            },
+                                            'props': text_props,
                                             'text': f'类型：{mtype}'
                                         },
                                         {
                                             'component': 'VCardText',
-                                            'props': {
-                                                'class': 'pa-0 px-2'
-                                            },
+                                            'props': text_props,
                                             'text': f'订阅时间：{time_str}'
                                         }
                                     ]
@@ -504,8 +513,6 @@ class MaoyanRank(_PluginBase):
         参数 platformType: 代表平台 0 全网 3 腾讯视频 2 爱奇艺 1 优酷 7 芒果 5 搜狐 4 乐视 6 PPTV
         """
         logger.info(f"开始刷新猫眼榜单...")
-        # 获取当前日期时间
-        current_time = datetime.datetime.now()
         nums = self._num
         #
         history: List[dict] = self.get_data('history') or []
@@ -515,9 +522,9 @@ class MaoyanRank(_PluginBase):
         if 'movie' in self._type:
             movie_url = 'https://piaofang.maoyan.com/dashboard-ajax/movie'
         if 'web-heat' in self._type:
-            # 获取当前日期时间格式化为字符串
+            # 获取当前日期格式化为字符串, 只需要日期无需构造完整datetime
             url_header = 'https://piaofang.maoyan.com/dashboard/webHeatData'
-            format_date = current_time.strftime("%Y%m%d")
+            format_date = datetime.date.today().strftime("%Y%m%d")
             if len(self._seriesType) == 3:
                 tv_urls = [
                     f'{url_header}?showDate={format_date}&platformType={self._platform}',
@@ -532,6 +539,10 @@ class MaoyanRank(_PluginBase):
                     tv_urls.append(
                         f'{url_header}?showDate={format_date}&seriesType={series}&platformType={self._platform}',
                     )
+        # 没有任何榜单需要抓取时直接返回, 不启动浏览器
+        if not movie_url and not tv_urls:
+            logger.info("未配置任何榜单类型，本次无需刷新")
+            return
         tv_list = []
         movie_list = []
         try:
@@ -545,14 +556,17 @@ class MaoyanRank(_PluginBase):
         logger.info(f"猫眼订阅刷新完成")
 
     def set_sub(self, addr_list, history, mtype):
-        # 获取当前日期时间
+        # 获取当前日期时间, 时间戳整轮复用一份, 不必每条记录重新格式化
         current_time = datetime.datetime.now()
+        time_str = current_time.strftime("%Y-%m-%d %H:%M:%S")
+        # 历史唯一标识一次性建索引, 避免每条榜单数据都全量扫描历史记录
+        seen_uniques = {h.get("unique") for h in history}
         for addr in addr_list:
             try:
                 title = addr.get('title')
                 try:
                     # 计算日期，获取年份信息
-                    subtract = int(''.join(re.findall(r'\d', addr.get('releaseInfo'))))
+                    subtract = int(''.join(_digit_pattern.findall(addr.get('releaseInfo'))))
                     target_time = current_time - datetime.timedelta(days=subtract)
                     year = target_time.year
                 except Exception as e:
@@ -563,7 +577,7 @@ class MaoyanRank(_PluginBase):
                 meta.year = year
                 unique_flag = f"maoyanrank: {mtype}_{title}_{year}"
                 # 检查是否已处理过
-                if unique_flag in [h.get("unique") for h in history]:
+                if unique_flag in seen_uniques:
                     continue
                 # 匹配媒体信息
                 mediainfo: MediaInfo = self.chain.recognize_media(meta=meta, mtype=mtype, cache=False)
@@ -598,9 +612,10 @@ class MaoyanRank(_PluginBase):
                     "poster": mediainfo.get_poster_image(),
                     "overview": mediainfo.overview,
                     "tmdbid": mediainfo.tmdb_id,
-                    "time": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    "time": time_str,
                     "unique": unique_flag
                 })
+                seen_uniques.add(unique_flag)
             except Exception as e:
                 logger.error(str(e))
 
@@ -611,14 +626,30 @@ class MaoyanRank(_PluginBase):
         movies_list = []
         tv_list = []
 
+        # 数据整理函数只定义一次, 不在循环体内反复创建
+        def info(movie):
+            infos = movie.get('movieInfo')
+            return {
+                "title": infos.get('movieName'),
+                "releaseInfo": infos.get('releaseInfo'),
+            }
+
+        def tv_info(tv):
+            infos = tv.get('seriesInfo')
+            return {
+                "title": infos.get('name'),
+                "releaseInfo": infos.get('releaseInfo'),
+                "platformDesc": infos.get('platformDesc'),
+            }
+
         with sync_playwright() as p:
             browser = p.chromium.launch(headless=False)
             try:
                 context = browser.new_context(user_agent=self.get_random_user_agent())
-                page1 = context.new_page()
-                page2 = context.new_page()
+                # 页面按需创建, 只配置单类榜单时不用多开一个空白页
                 if movie_url:
                     try:
+                        page1 = context.new_page()
                         # 打开网页
                         page1.goto(movie_url)
                         # 获取页面内容
@@ -626,18 +657,11 @@ class MaoyanRank(_PluginBase):
                         body = etree.HTML(html_text1)
                         res = json.loads(str(body.xpath('//body//text()')[0]))
                         data = res.get('movieList', {}).get('list', [])
-
-                        def info(movie):
-                            infos = movie.get('movieInfo')
-                            return {
-                                "title": infos.get('movieName'),
-                                "releaseInfo": infos.get('releaseInfo'),
-                            }
-
                         movies_list = [info(i) for i in data][:num]
                     except Exception as e:
                         logger.error(f"获取网页源码失败: {str(e)}")
                 if tv_urls:
+                    page2 = context.new_page()
                     for tv_url in tv_urls:
                         try:
                             # 打开网页
@@ -647,15 +671,6 @@ class MaoyanRank(_PluginBase):
                             body = etree.HTML(html_text2)
                             res = json.loads(str(body.xpath('//body//text()')[0]))
                             data = res.get('dataList', {}).get('list', [])
-
-                            def tv_info(tv):
-                                infos = tv.get('seriesInfo')
-                                return {
-                                    "title": infos.get('name'),
-                                    "releaseInfo": infos.get('releaseInfo'),
-                                    "platformDesc": infos.get('platformDesc'),
-                                }
-
                             tv_list.extend([tv_info(i) for i in data][:num])
                         except Exception as e:
                             logger.error(f"获取网页源码失败: {str(e)}")
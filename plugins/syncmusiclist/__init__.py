@@ -61,6 +61,9 @@ class SyncMusicList(_PluginBase):
     _qqmusic_paths = ""
     # 退出事件
     _event = Event()
+    # 表单结构是静态的,只构建一次缓存复用;账号状态提示每次渲染前更新
+    _form_schema = None
+    _form_status_props = None
 
     def init_plugin(self, config: dict = None):
         # docker用默认路径
@@ -166,6 +169,25 @@ class SyncMusicList(_PluginBase):
             self._wylogin_status = True
             self._wyy_text = f"当前未登录网抑云账号,部分功能受限,请选择对应方式登录"
         self._login_status = not self._wylogin_status
+        if SyncMusicList._form_status_props is None:
+            SyncMusicList._form_status_props = {
+                'type': 'info',
+                'variant': 'tonal',
+                'title': '账号状态',
+                'text': self._wyy_text
+            }
+            SyncMusicList._form_schema = self.__build_form_schema()
+        else:
+            SyncMusicList._form_status_props['text'] = self._wyy_text
+        return SyncMusicList._form_schema, {
+            "enabled": False,
+            "cron": "0 0 */7 * *",
+            "mode": "",
+            "scraper_paths": "",
+            "err_hosts": ""
+        }
+
+    def __build_form_schema(self) -> List[dict]:
         return [
             {
                 'component': 'VForm',
@@ -307,12 +329,7 @@ class SyncMusicList(_PluginBase):
                                 'content': [
                                     {
                                         'component': 'VAlert',
-                                        'props': {
-                                            'type': 'info',
-                                            'variant': 'tonal',
-                                            'title': '账号状态',
-                                            'text': self._wyy_text
-                                        }
+                                        'props': SyncMusicList._form_status_props
                                     }
                                 ]
                             }
@@ -648,13 +665,7 @@ class SyncMusicList(_PluginBase):
                     }
                 ]
             }
-        ], {
-            "enabled": False,
-            "cron": "0 0 */7 * *",
-            "mode": "",
-            "scraper_paths": "",
-            "err_hosts": ""
-        }
+        ]
 
     def get_page(self) -> List[dict]:
         pass
@@ -667,6 +678,8 @@ class SyncMusicList(_PluginBase):
         plex_on = False
         emby_on = False
         emby_users = []
+        # 同一次同步中用户查询结果缓存, 同名用户只请求一次
+        self._emby_user_cache = {}
         if not self._wymusic_paths and not self._qqmusic_paths  and not self._username:
             logger.info("同步配置为空,不进行处理。告退......")
             return
@@ -689,9 +702,14 @@ class SyncMusicList(_PluginBase):
         # 获取同步列表信息
         if self._qqmusic_paths:
             qq = QQMusicApi()
-            qqmusic_paths = self._qqmusic_paths.split("\n")
+            qqmusic_paths = self._qqmusic_paths.splitlines()
             for path in qqmusic_paths:
-                data_list = path.split(':')
+                path = path.strip()
+                # 跳过空行,避免多余的行尾换行触发格式告警
+                if not path:
+                    continue
+                # 最多三段配置, 限定分割次数, 用户列表中出现冒号也不会误判为格式错误
+                data_list = path.split(':', 2)
                 if len(data_list) == 2:
                     qq_play_id, media_playlist = data_list[0], data_list[1]
                 elif len(data_list) == 3:
@@ -714,9 +732,14 @@ class SyncMusicList(_PluginBase):
                 else:
                     logger.warn(f"QQ音乐歌单同步设置配置不规范,请认真检查修改")
         if self._wymusic_paths:
-            wymusic_paths = self._wymusic_paths.split("\n")
+            wymusic_paths = self._wymusic_paths.splitlines()
             for path in wymusic_paths:
-                data_list = path.split(':')
+                path = path.strip()
+                # 跳过空行,避免多余的行尾换行触发格式告警
+                if not path:
+                    continue
+                # 最多三段配置, 限定分割次数, 用户列表中出现冒号也不会误判为格式错误
+                data_list = path.split(':', 2)
                 if len(data_list) == 2:
                     wy_play_id, media_playlist = data_list[0], data_list[1]
                 elif len(data_list) == 3:
@@ -771,37 +794,53 @@ class SyncMusicList(_PluginBase):
         else:
             logger.warn(f"网易云音乐歌单同步设置配置不规范,请认真检查修改")
 
+    def __get_emby_user(self, em, user_name):
+        """获取Emby用户ID, 单次同步内缓存复用"""
+        user_id = self._emby_user_cache.get(user_name)
+        if user_id is None:
+            user_id = em.get_user(user_name)
+            self._emby_user_cache[user_name] = user_id
+        return user_id
+
     def __t_emby(self, em, t_tracks, media_playlist, emby_users=None):
         if emby_users is None:
             emby_users = [em.default_user]
         one_user = emby_users[0]
         other_users = emby_users[1:]
-        em.user = em.get_user(one_user)
+        em.user = self.__get_emby_user(em, one_user)
         em.get_music_library()
         logger.info("Emby开始同步歌单,涉及搜索时间较长请耐心等待.......")
         playlist_id, music_ids, music_names = em.get_tracks_by_playlist(media_playlist)
         logger.info(f"Emby歌单[{media_playlist}]现有歌曲[{len(music_names)}]首,列表为: {music_names}")
         if music_names:
-            new_tracks = [i for i in t_tracks if i[0] not in music_names]
+            # 用集合做存在性判断,歌单大时避免逐个线性扫描
+            music_names_set = set(music_names)
+            new_tracks = [i for i in t_tracks if i[0] not in music_names_set]
         else:
             new_tracks = t_tracks
         # new_tracks = list(set(i[0] for i in t_tracks) - set(music_names))
-        tracks = em.mul_search_music(new_tracks, self._exact_match)
+        # 没有新增歌曲时跳过搜索,避免空列表也发起接口调用
+        tracks = em.mul_search_music(new_tracks, self._exact_match) if new_tracks else []
         if playlist_id:
-            ids = [i for i in tracks if i not in music_ids]
-            em.set_tracks_to_playlist(playlist_id, ','.join(ids))
+            music_ids_set = set(music_ids)
+            ids = [i for i in tracks if i not in music_ids_set]
+            if ids:
+                em.set_tracks_to_playlist(playlist_id, ','.join(ids))
         else:
             em.create_playlist(media_playlist, ','.join(tracks))
         _, new_music_ids, _ = em.get_tracks_by_playlist(media_playlist)
+        # 创建歌单用的id串每个用户都一样,循环外拼一次即可
+        new_music_ids_str = ','.join(new_music_ids)
         for user in other_users:
-            em.user = em.get_user(user)
+            em.user = self.__get_emby_user(em, user)
             em.get_music_library()
             user_playlist_id, user_music_ids, user_music_names = em.get_tracks_by_playlist(media_playlist)
             if user_playlist_id:
-                new_ids = [i for i in new_music_ids if i not in user_music_ids]
+                user_music_ids_set = set(user_music_ids)
+                new_ids = [i for i in new_music_ids if i not in user_music_ids_set]
                 em.set_tracks_to_playlist(user_playlist_id, ','.join(new_ids), user)
             else:
-                em.create_playlist(media_playlist, ','.join(new_music_ids), user)
+                em.create_playlist(media_playlist, new_music_ids_str, user)
 
         logger.info("Emby同步歌单完成,感谢耐心等待.......")
         logger.info("歌单同步完成，END")
@@ -813,9 +852,11 @@ class SyncMusicList(_PluginBase):
         old_tracks = []
         plex_tracks = pm.get_tracks_by_playlist(media_playlist)
         logger.debug(f"plex播放列表 [{media_playlist}] 已存在歌曲[{len(plex_tracks)}]首,列表为: {plex_tracks}")
+        # 已存在歌曲集合化, 避免逐首线性扫描
+        plex_tracks_set = set(plex_tracks)
         # 查找获取tracks
         for t_track in t_tracks:
-            if t_track[0] in plex_tracks:
+            if t_track[0] in plex_tracks_set:
                 old_tracks.append(t_track)
                 continue
             try:
@@ -824,9 +865,11 @@ class SyncMusicList(_PluginBase):
                 logger.error(f"搜索歌曲失败,err:{e}")
                 tracks = []
             add_tracks += tracks
-        # 去重
-        add_tracks = list(set(add_tracks))
-        no_list = list(set(i[0] for i in t_tracks) - set([i.title for i in add_tracks]) - set(i[0] for i in old_tracks))
+        # 去重, dict.fromkeys在C层完成且保留搜索顺序
+        add_tracks = list(dict.fromkeys(add_tracks))
+        # 歌名列表只整理一次, 日志和差集复用
+        add_titles = [i.title for i in add_tracks]
+        no_list = list(set(i[0] for i in t_tracks) - set(add_titles) - set(i[0] for i in old_tracks))
         logger.info(f"Plex库中未搜到歌曲[{len(no_list)}]首,列表为: {no_list}")
         # 有歌曲写入没有就跳过
         if len(add_tracks) > 0:
@@ -834,13 +877,13 @@ class SyncMusicList(_PluginBase):
                 try:
                     # 创建如果存在创建失败就进行添加
                     pm.create_playlist(media_playlist, add_tracks)
-                    logger.info(f"Plex创建播放列表[{media_playlist}]成功，并添加歌曲[{len(add_tracks)}]首,列表为: {[i.title for i in add_tracks]}")
+                    logger.info(f"Plex创建播放列表[{media_playlist}]成功，并添加歌曲[{len(add_tracks)}]首,列表为: {add_titles}")
                 except Exception as err:
                     logger.error(f"{err}")
             else:
                 try:
                     pm.set_tracks_to_playlist(media_playlist, add_tracks)
-                    logger.info(f"Plex向播放列表[{media_playlist}]添加歌曲[{len(add_tracks)}]首,列表为: {[i.title for i in add_tracks]}成功")
+                    logger.info(f"Plex向播放列表[{media_playlist}]添加歌曲[{len(add_tracks)}]首,列表为: {add_titles}成功")
                 except Exception as e:
                     logger.error(f"{e}")
         else:
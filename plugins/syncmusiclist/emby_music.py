@@ -29,15 +29,15 @@ class EmbyMusic(Emby):
             res = RequestUtils().get_res(req_url)
             if res:
                 users = res.json()
-                # 先查询是否有与当前用户名称匹配的
-                if user_name:
-                    for user in users:
-                        if user.get("Name") == user_name:
-                            return user.get("Name")
-                # 查询管理员
+                # 单次遍历: 命中当前用户名直接返回, 同时记下首个管理员兜底
+                admin_name = None
                 for user in users:
-                    if user.get("Policy", {}).get("IsAdministrator"):
+                    if user_name and user.get("Name") == user_name:
                         return user.get("Name")
+                    if admin_name is None and user.get("Policy", {}).get("IsAdministrator"):
+                        admin_name = user.get("Name")
+                if admin_name:
+                    return admin_name
             else:
                 logger.error(f"Users 未获取到返回数据")
         except Exception as e:
@@ -112,13 +112,19 @@ class EmbyMusic(Emby):
         except Exception as err:
             logger.error(f"Emby获取播放列表失败: {err}")
             tracks = []
-        music_ids = [i.get('Id') for i in tracks if i.get('Type') == 'Audio']
-        music_names = [i.get('Name') for i in tracks if i.get('Type') == 'Audio']
+        # 一次遍历同时取Id和Name, 不做两轮过滤
+        music_ids = []
+        music_names = []
+        for i in tracks:
+            if i.get('Type') == 'Audio':
+                music_ids.append(i.get('Id'))
+                music_names.append(i.get('Name'))
         return playlist_id, music_ids, music_names
 
     def create_playlist(self, name, ids, user=settings.SUPERUSER):
         """创建播放列表"""
-        if name in [i.get('Name') for i in self.music_playlists]:
+        # 生成器短路判断, 不用为存在性检查物化整个名称列表
+        if any(name == i.get('Name') for i in self.music_playlists):
             logger.info(f"Emby歌单: [{name}] 已经存在，跳过创建")
         # Playlists
         url = f'{self._host}emby/Playlists?api_key={self._apikey}&userId={self.user}&Name={name}&Ids={ids}'
@@ -165,15 +171,19 @@ class EmbyMusic(Emby):
         url = f'{self._host}emby/Users/{self.user}/Items?Recursive=true&SearchTerm={name}&api_key={self._apikey}'
         try:
             res = self.get_data(url)
-            count = res.json().get("TotalRecordCount")
+            # 响应体只解析一次, 不重复json反序列化
+            res_json = res.json()
+            count = res_json.get("TotalRecordCount")
             if count > 0:
-                items = res.json().get("Items")
+                items = res_json.get("Items")
                 if exact_match:
                     add_items = []
+                    # 歌手集合提前构建一次, 不在每个候选条目里重复转换
+                    singers_set = set(singers)
                     # 通过歌手过滤
                     for i in items:
                         arts = i.get("Artists", [])
-                        if len(set(arts) & set(singers)) > 0:
+                        if set(arts) & singers_set:
                             # add
                             add_items = [i]
                             break
@@ -189,8 +199,14 @@ class EmbyMusic(Emby):
                 else:
                     add_items = items
 
-                ids_list = [i.get('Id') for i in add_items if i.get('Type') == 'Audio'][:1]
-                name_list = [i.get('Name') for i in add_items if i.get('Type') == 'Audio'][:1]
+                # 只取第一首音频, 单次遍历即可
+                ids_list = []
+                name_list = []
+                for i in add_items:
+                    if i.get('Type') == 'Audio':
+                        ids_list.append(i.get('Id'))
+                        name_list.append(i.get('Name'))
+                        break
             else:
                 ids_list = []
                 name_list = []
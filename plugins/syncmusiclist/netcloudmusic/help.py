@@ -1,3 +1,4 @@
+import functools
 import json
 import pkg_resources
 
@@ -38,9 +39,11 @@ def api_help(name: str = None) -> str:
     return result_str
 
 
+@functools.lru_cache(maxsize=1)
 def api_list():
     """
     获取接口列表
+    配置加载后列表不会变化, 缓存结果避免每次请求都重新过滤
     :return:
     """
-    return [item for item in list(config.keys()) if item not in exclude]
+    return [item for item in config.keys() if item not in exclude]
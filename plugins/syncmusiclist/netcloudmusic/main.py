@@ -15,6 +15,17 @@ from .utils import format_cookie_str, prase_cookie_str
 import urllib.parse
 
 
+# 路由别名固定不变, 放在模块级避免每次请求重建字典
+SPECIAL_ROUTES = {
+    'daily_signin': '/daily_signin',
+    'fm_trash': '/fm_trash',
+    'personal_fm': '/personal_fm',
+}
+
+YUBEI_SPECIAL_ROUTES = {'/yunbei/tasks/receipt': '/yunbei/receipt',
+                        '/yunbei/tasks/expense': '/yunbei/expense'}  # 这俩个接口准换的路由莫名奇妙
+
+
 class NeteaseCloudMusicApi:
     __cookie = None
     __ip = None
@@ -28,6 +39,8 @@ class NeteaseCloudMusicApi:
             self.cache = Cache(str(self.path), timeout=120)  # 设置缓存目录和过期时间
         else:
             self.cache = Cache('cache', timeout=120)  # 设置缓存目录和过期时间
+        # cookie文件路径只拼一次, 存取时直接用字符串
+        self.cookie_path = os.path.join(str(self.path), "cookie_storage") if self.path else "cookie_storage"
 
         self.DEBUG = debug  # 是否开启调试模式
         self.CACHE = cach  # 是否开启缓存
@@ -54,40 +67,32 @@ class NeteaseCloudMusicApi:
         :return: 请求结果 示例：{"code": 200, "data": {}, "msg": "success"}
         """
 
-        special = {
-            'daily_signin': '/daily_signin',
-            'fm_trash': '/fm_trash',
-            'personal_fm': '/personal_fm',
-        }
-
-        yubei_special = {'/yunbei/tasks/receipt': '/yunbei/receipt',
-                         '/yunbei/tasks/expense': '/yunbei/expense'}  # 这俩个接口准换的路由莫名奇妙
-
         # 测试name是否合法
         name.replace("\\", "/")
         if not name.startswith("/"):
-            if name in special.keys():
-                name = special[name]
+            if name in SPECIAL_ROUTES.keys():
+                name = SPECIAL_ROUTES[name]
             else:
                 name = "/" + name
                 name = name.replace("_", "/")
 
         # 处理俩个云贝接口名称转换问题
-        if name in yubei_special.keys():
-            name = yubei_special[name]
+        if name in YUBEI_SPECIAL_ROUTES.keys():
+            name = YUBEI_SPECIAL_ROUTES[name]
             # print("转换了个麻烦的路由", name)
 
         if name not in api_list():
-            if name not in yubei_special.values():
+            if name not in YUBEI_SPECIAL_ROUTES.values():
                 raise Exception(f"apiName: {name} not found，please use ”api_list()“ to view the interface list")
 
         # 生成一个唯一的键，用于在缓存中查找结果
         cache_key = (name, frozenset(query.items()) if query else None)
 
         if self.CACHE:
-            # 检查缓存中是否已经有了结果
-            if self.cache.get(cache_key):
-                return self.cache.get(cache_key)
+            # 检查缓存中是否已经有了结果, 只查一次缓存
+            cached_result = self.cache.get(cache_key)
+            if cached_result:
+                return cached_result
 
         if query is None:
             query = {}
@@ -134,7 +139,7 @@ class NeteaseCloudMusicApi:
     def cookie(self):
         if self.__cookie is None:
 
-            cookie_path = str(self.path / "cookie_storage") if self.path else "cookie_storage"
+            cookie_path = self.cookie_path
             if os.path.isfile(cookie_path):
                 with open(cookie_path, "r", encoding='utf-8') as f:
                     content = f.read()
@@ -176,8 +181,7 @@ class NeteaseCloudMusicApi:
                 raise Exception(f"cookie is illegal, missing key: {key}.")
 
         self.__cookie = value
-        cookie_path = str(self.path / "cookie_storage") if self.path else "cookie_storage"
-        with open(cookie_path, "w+", encoding='utf-8') as f:
+        with open(self.cookie_path, "w+", encoding='utf-8') as f:
             f.write(json.dumps({"cookie": value, "create_time_stamp": time.time()}, indent=2, ensure_ascii=False))
 
     @property
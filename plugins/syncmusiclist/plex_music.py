@@ -17,6 +17,16 @@ class PlexMusic(Plex):
         self.music_libraries = []
         self.music_playlists = []
         self.music_names = []
+        # 同一次同步中同一个播放列表会被查询多次, 缓存查询结果
+        self._playlist_cache = {}
+
+    def __get_playlist(self, playlist_title):
+        """获取播放列表对象, 单次同步内缓存复用"""
+        playlist = self._playlist_cache.get(playlist_title)
+        if playlist is None:
+            playlist = self._plex.playlist(playlist_title)
+            self._playlist_cache[playlist_title] = playlist
+        return playlist
 
     def get_user_name(self):
         account = MyPlexAccount(self._token)
@@ -70,7 +80,7 @@ class PlexMusic(Plex):
         if playlist_title not in self.music_playlists:
             logger.warn(f"Plex媒体库中播放列表为:{self.music_playlists}\n 不存在: {playlist_title}, 稍后会自动创建，如果失败请手动创建")
             return []
-        playlist = self._plex.playlist(playlist_title)
+        playlist = self.__get_playlist(playlist_title)
         # 获取歌单中的歌曲
         tracks = playlist.items()
         music_names = [i.title for i in tracks]
@@ -82,7 +92,7 @@ class PlexMusic(Plex):
 
     def set_tracks_to_playlist(self, playlist_title, tracks):
         """添加歌曲到歌单中"""
-        playlist = self._plex.playlist(playlist_title)
+        playlist = self.__get_playlist(playlist_title)
         playlist.addItems(tracks)
 
     def search(self, query, mediatype=None, limit=None, sectionId=None):
@@ -1,22 +1,28 @@
+import functools
 import re
 
 
+# 预编译正则, 每首歌每个歌手都会调用, 不必每次重新编译
+_bracket_pattern = re.compile(r'\s*[\(\（\[【<《][^\)\）\]】>》]*[\)\）\]】>》]\s*')
+_chinese_pattern = re.compile(r'[\u4e00-\u9fa5]')
+_chinese_seq_pattern = re.compile(r'[\u4e00-\u9fa5]+')
+
+
 def sub_str(text):
-    return re.sub(r'\s*[\(\（\[【<《][^\)\）\]】>》]*[\)\）\]】>》]\s*', '', text)
+    return _bracket_pattern.sub('', text)
 
 def contains_chinese(text):
     """判断字符串是否包含中文字符"""
-    pattern = re.compile(r'[\u4e00-\u9fa5]')
-    return bool(pattern.search(text))
+    return bool(_chinese_pattern.search(text))
 
 def extract_chinese(text):
     """提取字符串中的中文字符"""
-    pattern = re.compile(r'[\u4e00-\u9fa5]+')
-    return pattern.findall(text)[0]
+    return _chinese_seq_pattern.findall(text)[0]
 
+@functools.lru_cache(maxsize=2048)
 def change_str(text):
+    # 歌手名在歌单间大量重复, 缓存清洗结果避免重复跑正则
     text = sub_str(text)
     if contains_chinese(text):
         text = extract_chinese(text)
     return text
-